@@ -0,0 +1,309 @@
+"""
+Benchmark suite for the pyvallib pricing models.
+
+Measures wall time and peak memory of each model across a range of input sizes and stores the results as JSON so
+that two commits can be compared.
+
+Usage:
+python benchmarks/bench.py run                     # writes .benchmarks/<commit>.json
+python benchmarks/bench.py run --quick -k binomial  # smallest sizes only, filtered by name
+python benchmarks/bench.py compare <base> <head>    # commit hashes or paths to JSON result files
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parents[1]
+RESULTS_DIR = ROOT / ".benchmarks"
+
+# Mirror the pytest configuration so the suite runs against the working tree without an install
+sys.path.insert(0, str(ROOT / "src"))
+
+from pyvallib.cfi import OPM, BinomialAmerican, BinomialCRR, BlackScholes, MonteCarlo  # noqa: E402
+from pyvallib.dlom import Chaffe, DifferentialPut, Finnerty, Ghaidarov  # noqa: E402
+from pyvallib.pv.yearfrac import yearfrac  # noqa: E402
+
+BENCHMARKS = {}
+
+
+def benchmark(name, sizes, quick=None):
+    """
+    Register a benchmark case.
+
+    Parameters:
+    name: The name of the benchmark case
+    sizes: The input sizes the case is run at
+    quick: The subset of sizes run with --quick (default is the smallest size)
+    """
+
+    def decorator(setup):
+        BENCHMARKS[name] = {"setup": setup, "sizes": list(sizes), "quick": list(quick or sizes[:1])}
+        return setup
+
+    return decorator
+
+
+# Each case receives a size and returns a zero-argument callable that performs the work being measured
+
+
+@benchmark("binomial.generate_lattice", sizes=[100, 250, 500, 1000])
+def bench_generate_lattice(M):
+    return BinomialCRR(10, 5, 0.45, 0.05, M).generate_lattice
+
+
+@benchmark("binomial.american_put", sizes=[100, 250, 500, 1000])
+def bench_binomial_american(M):
+    return BinomialAmerican(10, 10, 5, 0.45, 0.05, M).put_price
+
+
+@benchmark("montecarlo.generate_paths", sizes=[(10_000, 12), (100_000, 12), (100_000, 52), (1_000_000, 4)])
+def bench_generate_paths(size):
+    n, steps = size
+    return MonteCarlo(10, np.linspace(5 / steps, 5, steps), 0.45, 0.05, n).generate_paths
+
+
+@benchmark("blackscholes.call_price", sizes=[1, 1_000, 100_000, 1_000_000])
+def bench_blackscholes(length):
+    rng = np.random.default_rng(2024)
+    S = rng.uniform(5, 15, length)
+    return lambda: BlackScholes(S, 10, 5, 0.45, 0.05).call_price()
+
+
+# Per-call latency of single quotes with Python float inputs (scalar fast path) and 0-d array inputs (numpy path)
+
+
+@benchmark("blackscholes.single_quote", sizes=["float", "ndarray"], quick=["float", "ndarray"])
+def bench_blackscholes_single_quote(input_type):
+    inputs = [10.0, 10.0, 5.0, 0.45, 0.05]
+    if input_type == "ndarray":
+        inputs = [np.asarray(x) for x in inputs]
+    return lambda: BlackScholes(*inputs).call_price()
+
+
+@benchmark("dlom.chaffe_single_quote", sizes=["float", "ndarray"], quick=["float", "ndarray"])
+def bench_chaffe_single_quote(input_type):
+    inputs = [5.0, 0.45, 0.05]
+    if input_type == "ndarray":
+        inputs = [np.asarray(x) for x in inputs]
+    return Chaffe(*inputs).calculate_dlom
+
+
+@benchmark("dlom.differential_put_single_quote", sizes=["float", "ndarray"], quick=["float", "ndarray"])
+def bench_differential_put_single_quote(input_type):
+    inputs = [5.0, 0.30, 0.45, 0.05]
+    if input_type == "ndarray":
+        inputs = [np.asarray(x) for x in inputs]
+    return DifferentialPut(*inputs).calculate_dlom
+
+
+@benchmark("opm.backsolve", sizes=[5, 20, 50])
+def bench_opm_backsolve(n_classes):
+    # Each senior class has a liquidation preference, then all classes participate pro rata
+    breakpoints = np.concatenate([[0], np.cumsum(np.full(n_classes - 1, 2e6))])
+    participation = np.zeros((n_classes, n_classes))
+    participation[np.arange(n_classes - 1), np.arange(n_classes - 1)] = 1
+    participation[-1] = 1 / n_classes
+    opm = OPM(breakpoints, participation, np.full(n_classes, 1e6), 4, 0.55, 0.04)
+    return lambda: opm.backsolve(1.50, n_classes // 4)
+
+
+@benchmark("dlom.chaffe", sizes=[1, 1_000, 100_000])
+def bench_chaffe(length):
+    T = np.linspace(0.5, 5, length)
+    return Chaffe(T, 0.45, 0.05).calculate_dlom
+
+
+@benchmark("dlom.differential_put", sizes=[1, 1_000, 100_000])
+def bench_differential_put(length):
+    T = np.linspace(0.5, 5, length)
+    return DifferentialPut(T, 0.30, 0.45, 0.05).calculate_dlom
+
+
+# Finnerty and Ghaidarov evaluate the normal distribution with statistics.NormalDist, which only accepts scalars, so
+# these cases time a loop of scalar calls instead of a single array call
+
+
+@benchmark("dlom.finnerty", sizes=[1, 100, 1_000])
+def bench_finnerty(length):
+    T = np.linspace(0.5, 5, length).tolist()
+    return lambda: [Finnerty(t, 0.45).calculate_dlom() for t in T]
+
+
+@benchmark("dlom.ghaidarov", sizes=[1, 100, 1_000])
+def bench_ghaidarov(length):
+    T = np.linspace(0.5, 5, length).tolist()
+    return lambda: [Ghaidarov(t, 0.45).calculate_dlom() for t in T]
+
+
+@benchmark("pv.yearfrac_30_360", sizes=[1, 100, 1_000])
+def bench_yearfrac_30_360(length):
+    start = pd.Timestamp(2020, 2, 29)
+    end_dates = (pd.date_range("2021-02-01", periods=length, freq="MS") - pd.Timedelta(days=1)).tolist()
+    return lambda: [yearfrac(start, end, 0) for end in end_dates]
+
+
+@benchmark("pv.yearfrac_actual_actual", sizes=[1, 100, 1_000])
+def bench_yearfrac_actual_actual(length):
+    start = pd.Timestamp(2020, 2, 29)
+    end_dates = (pd.date_range("2021-02-01", periods=length, freq="MS") - pd.Timedelta(days=1)).tolist()
+    return lambda: [yearfrac(start, end, 1) for end in end_dates]
+
+
+def measure(func, repeat, min_time=0.05):
+    """
+    Time a callable and record its peak traced memory.
+
+    Each timing sample runs the callable enough times to take at least min_time seconds, so very fast calls are not
+    dominated by timer resolution. Peak memory is measured in a separate run because tracing slows down allocation.
+    """
+    func()  # warm up
+
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or loops >= 1_000_000:
+            break
+        loops *= 10
+
+    samples = [elapsed / loops]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        samples.append((time.perf_counter() - start) / loops)
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "loops": loops,
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "peak_memory": peak,
+    }
+
+
+def git_commit():
+    """Short hash of the checked out commit, suffixed with '-dirty' when the working tree has changes"""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"], cwd=ROOT, capture_output=True, text=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return f"{commit}-dirty" if dirty else commit
+
+
+def format_size(size):
+    return "x".join(str(x) for x in size) if isinstance(size, (tuple, list)) else str(size)
+
+
+def run(args):
+    commit = git_commit()
+    results = {}
+    for name, case in BENCHMARKS.items():
+        if args.filter and not any(f in name for f in args.filter):
+            continue
+        for size in case["quick"] if args.quick else case["sizes"]:
+            key = f"{name}[{format_size(size)}]"
+            result = measure(case["setup"](size), args.repeat)
+            results[key] = {"benchmark": name, "size": size, **result}
+            print(f"{key:<45} {result['median'] * 1e3:>12.4f} ms {result['peak_memory'] / 2**20:>10.2f} MiB")
+
+    output = Path(args.output) if args.output else RESULTS_DIR / f"{commit}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    metadata = {
+        "commit": commit,
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+    }
+    output.write_text(json.dumps({"metadata": metadata, "results": results}, indent=2) + "\n")
+    print(f"\nResults written to {output}")
+
+
+def load(ref):
+    """Load results from a JSON file path or from the results directory by commit hash"""
+    path = Path(ref)
+    if not path.is_file():
+        matches = sorted(RESULTS_DIR.glob(f"{ref}*.json"))
+        if len(matches) != 1:
+            raise SystemExit(f"Expected exactly one result file matching '{ref}', found {len(matches)}")
+        path = matches[0]
+    return json.loads(path.read_text())
+
+
+def compare(args):
+    base, head = load(args.base), load(args.head)
+    print(f"base: {base['metadata']['commit']}  head: {head['metadata']['commit']}\n")
+    print(f"{'benchmark':<45} {'base ms':>12} {'head ms':>12} {'time':>8} {'memory':>8}")
+
+    regressions = []
+    for key in sorted(base["results"].keys() & head["results"].keys()):
+        b, h = base["results"][key], head["results"][key]
+        time_ratio = h["median"] / b["median"]
+        memory_ratio = h["peak_memory"] / b["peak_memory"] if b["peak_memory"] else 1.0
+        flag = ""
+        if time_ratio > args.threshold or memory_ratio > args.threshold:
+            regressions.append(key)
+            flag = "  <-- regression"
+        print(
+            f"{key:<45} {b['median'] * 1e3:>12.4f} {h['median'] * 1e3:>12.4f} "
+            f"{time_ratio:>7.2f}x {memory_ratio:>7.2f}x{flag}"
+        )
+
+    for key in sorted(base["results"].keys() ^ head["results"].keys()):
+        print(f"{key:<45} only in {'base' if key in base['results'] else 'head'}")
+
+    if regressions:
+        print(f"\n{len(regressions)} benchmark(s) slower or larger than {args.threshold:.2f}x base")
+        sys.exit(1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="run the benchmark suite")
+    run_parser.add_argument("-k", "--filter", action="append", help="only run benchmarks containing this string")
+    run_parser.add_argument("--quick", action="store_true", help="only run the smallest input sizes")
+    run_parser.add_argument("--repeat", type=int, default=5, help="number of timing samples per case")
+    run_parser.add_argument("-o", "--output", help="output JSON path (default is .benchmarks/<commit>.json)")
+    run_parser.set_defaults(func=run)
+
+    compare_parser = subparsers.add_parser("compare", help="compare two result files")
+    compare_parser.add_argument("base", help="base commit hash or result file")
+    compare_parser.add_argument("head", help="head commit hash or result file")
+    compare_parser.add_argument("--threshold", type=float, default=1.10, help="ratio flagged as a regression")
+    compare_parser.set_defaults(func=compare)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
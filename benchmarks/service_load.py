@@ -0,0 +1,125 @@
+"""
+Load generator for the local pricing service.
+
+Opens concurrent keep-alive connections that each send pricing requests back to back, then reports throughput and
+latency percentiles. Starts a server in a subprocess unless --port is given.
+
+Usage:
+python benchmarks/service_load.py --connections 64 --requests 200
+python benchmarks/service_load.py --window 0 --max-batch 1   # no batching, for comparison
+python benchmarks/service_load.py --port 8080                # against a running server
+"""
+
+import argparse
+import asyncio
+import json
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+PAYLOADS = {
+    "/blackscholes": {"S": 10, "K": 10, "T": 5, "sigma": 0.45, "r": 0.05, "option_type": "call"},
+    "/dlom/chaffe": {"T": 2, "sigma": 0.45, "r": 0.05},
+    "/dlom/finnerty": {"T": 2, "sigma": 0.45},
+    "/yearfrac": {"start_date": "2024-02-29", "end_date": "2026-06-30", "basis": 1},
+}
+
+
+async def client(host, port, endpoint, n_requests, latencies):
+    reader, writer = await asyncio.open_connection(host, port)
+    body = json.dumps(PAYLOADS[endpoint]).encode()
+    request = (
+        f"POST {endpoint} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n\r\n".encode("latin-1") + body
+    )
+    for _ in range(n_requests):
+        start = time.perf_counter()
+        writer.write(request)
+        await writer.drain()
+        status = await reader.readline()
+        content_length = 0
+        while (line := await reader.readline()) not in (b"\r\n", b""):
+            if line.lower().startswith(b"content-length:"):
+                content_length = int(line.split(b":")[1])
+        await reader.readexactly(content_length)
+        latencies.append(time.perf_counter() - start)
+        if b" 200 " not in status:
+            raise RuntimeError(f"Request failed: {status.decode().strip()}")
+    writer.close()
+    await writer.wait_closed()
+
+
+async def run_load(host, port, endpoint, connections, n_requests):
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*(client(host, port, endpoint, n_requests, latencies) for _ in range(connections)))
+    elapsed = time.perf_counter() - start
+    return elapsed, sorted(latencies)
+
+
+def percentile(sorted_values, p):
+    return sorted_values[min(len(sorted_values) - 1, int(p / 100 * len(sorted_values)))]
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(port, window, max_batch):
+    command = [sys.executable, "-m", "pyvallib.service", "--port", str(port), "--window", str(window)]
+    command += ["--max-batch", str(max_batch)]
+    server = subprocess.Popen(command, cwd=ROOT / "src", stdout=subprocess.DEVNULL)
+    deadline = time.monotonic() + 10
+    while True:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+            return server
+        except OSError:
+            if server.poll() is not None or time.monotonic() > deadline:
+                server.kill()
+                raise RuntimeError("Pricing service failed to start")
+            time.sleep(0.05)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, help="port of a running server (default starts a server)")
+    parser.add_argument("--endpoint", default="/blackscholes", choices=sorted(PAYLOADS))
+    parser.add_argument("--connections", type=int, default=64, help="number of concurrent connections")
+    parser.add_argument("--requests", type=int, default=200, help="number of requests per connection")
+    parser.add_argument("--window", type=float, default=0.002, help="batching window of the started server")
+    parser.add_argument("--max-batch", type=int, default=1024, help="maximum batch size of the started server")
+    args = parser.parse_args()
+
+    server = None
+    port = args.port
+    if port is None:
+        port = free_port()
+        server = start_server(port, args.window, args.max_batch)
+
+    try:
+        elapsed, latencies = asyncio.run(run_load(args.host, port, args.endpoint, args.connections, args.requests))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    print(f"endpoint:    {args.endpoint}")
+    print(f"requests:    {len(latencies)} over {args.connections} connections")
+    print(f"throughput:  {len(latencies) / elapsed:,.0f} requests/s")
+    print(f"latency p50: {percentile(latencies, 50) * 1e3:.3f} ms")
+    print(f"latency p99: {percentile(latencies, 99) * 1e3:.3f} ms")
+    print(f"latency max: {latencies[-1] * 1e3:.3f} ms")
+    print(f"latency avg: {statistics.fmean(latencies) * 1e3:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1 +1 @@
-from . import cfi, dlom, pv
+from . import cfi, dlom, portfolio, profiling, pv
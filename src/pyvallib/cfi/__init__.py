@@ -1,3 +1,4 @@
 from .binomial import BinomialAmerican, BinomialCRR
 from .blackscholes import BlackScholes
 from .montecarlo import MonteCarlo
+from .opm import OPM
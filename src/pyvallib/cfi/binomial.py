@@ -1,5 +1,7 @@
 import numpy as np
 
+from ..profiling import instrument
+
 
 class BinomialCRR:
     """
@@ -61,6 +63,7 @@ class BinomialCRR:
         """Probability of down movement"""
         return 1 - self.p_u
 
+    @instrument("binomial.generate_lattice")
     def generate_lattice(self):
         """Generate lattice of underlying stock prices"""
         lattice = np.zeros((self.M + 1, self.M + 1))
@@ -72,6 +75,7 @@ class BinomialCRR:
 
         return lattice
 
+    @instrument("binomial.rollback_lattice")
     def rollback_lattice(self, payoff_func, rollback_func):
         """
         Rollback lattice to calculate option price given the following parameters.
@@ -1,6 +1,24 @@
+import math
+
 import numpy as np
 from scipy.stats import norm
 
+from ..profiling import instrument
+
+
+def _norm_cdf(x):
+    """Standard normal cumulative distribution function of a Python float"""
+    return 0.5 * math.erfc(-x / math.sqrt(2))
+
+
+def _log_moneyness(S, K):
+    """log(S / K) of Python floats, with the limits numpy returns for zero inputs"""
+    if K == 0:
+        return math.inf if S > 0 else math.nan
+    if S == 0:
+        return -math.inf
+    return math.log(S / K)
+
 
 class BlackScholes:
     """
@@ -13,13 +31,32 @@ class BlackScholes:
     sigma: The volatility of the underlying asset
     r: The risk-free interest rate
     q: The continuous dividend yield (default is 0)
+    validate: Whether to check the inputs are in range (default is True, skip only for trusted inputs)
+
+    When all inputs are Python scalars, prices are calculated with the math module instead of numpy, which avoids the
+    array overhead that dominates single quote calls. Inputs for which the math module raises (e.g. an overflowing
+    dividend factor, or an out of range input with validate=False) are recalculated with numpy, so both paths return
+    the same inf or nan.
     """
 
-    def __init__(self, S, K, T, sigma, r, q=0.0):
-        if any((np.asarray(x) <= 0).any() for x in [T, sigma, r]):
-            raise ValueError("Expected inputs T, sigma, rfr to be greater than 0")
-        if any((np.asarray(x) < 0).any() for x in [S, K]):
-            raise ValueError("Expected inputs S, K to be greater than or equal to 0")
+    def __init__(self, S, K, T, sigma, r, q=0.0, validate=True):
+        self.scalar = all(isinstance(x, (int, float)) for x in [S, K, T, sigma, r, q])
+
+        if validate:
+            if self.scalar:
+                invalid_T_sigma_r = min(T, sigma, r) <= 0
+                invalid_S_K = min(S, K) < 0
+            else:
+                invalid_T_sigma_r = any((np.asarray(x) <= 0).any() for x in [T, sigma, r])
+                invalid_S_K = any((np.asarray(x) < 0).any() for x in [S, K])
+            if invalid_T_sigma_r:
+                raise ValueError("Expected inputs T, sigma, rfr to be greater than 0")
+            if invalid_S_K:
+                raise ValueError("Expected inputs S, K to be greater than or equal to 0")
+
+        if self.scalar:
+            self.S, self.K, self.T, self.sigma, self.r, self.q = S, K, T, sigma, r, q
+            return
 
         # Convert all inputs to numpy arrays
         self.S = np.asarray(S)
@@ -34,9 +71,22 @@ class BlackScholes:
         if len(set(shapes)) > 1:
             raise ValueError("All non-scalar inputs must have the same dimensions")
 
+    def _as_arrays(self):
+        """Same model with numpy inputs, which return inf or nan where the math module raises"""
+        return BlackScholes(
+            *[np.asarray(x) for x in [self.S, self.K, self.T, self.sigma, self.r, self.q]], validate=False
+        )
+
     @property
     def d1(self):
         """Calculates d1 values in  Black-Scholes formula"""
+        if self.scalar:
+            try:
+                return (_log_moneyness(self.S, self.K) + (self.r - self.q + 0.5 * self.sigma**2) * self.T) / (
+                    self.sigma * math.sqrt(self.T)
+                )
+            except (ArithmeticError, ValueError):
+                return float(self._as_arrays().d1)
         return (np.log(self.S / self.K) + (self.r - self.q + 0.5 * self.sigma**2) * self.T) / (
             self.sigma * np.sqrt(self.T)
         )
@@ -44,20 +94,45 @@ class BlackScholes:
     @property
     def d2(self):
         """Calculates d2 value in Black-Scholes formula"""
+        if self.scalar:
+            try:
+                return self.d1 - self.sigma * math.sqrt(self.T)
+            except (ArithmeticError, ValueError):
+                return float(self._as_arrays().d2)
         return self.d1 - self.sigma * np.sqrt(self.T)
 
+    @instrument("blackscholes.call_price")
     def call_price(self):
         """
         Calculates the price of a European call option using the Black-Scholes formula.
         """
+        if self.scalar:
+            try:
+                d1 = self.d1
+                d2 = d1 - self.sigma * math.sqrt(self.T)
+                return self.S * math.exp(-self.q * self.T) * _norm_cdf(d1) - self.K * math.exp(
+                    -self.r * self.T
+                ) * _norm_cdf(d2)
+            except (ArithmeticError, ValueError):
+                return float(self._as_arrays().call_price())
         return self.S * np.exp(-self.q * self.T) * norm.cdf(self.d1) - self.K * np.exp(-self.r * self.T) * norm.cdf(
             self.d2
         )
 
+    @instrument("blackscholes.put_price")
     def put_price(self):
         """
         Calculates the price of a European put option using the Black-Scholes formula.
         """
+        if self.scalar:
+            try:
+                d1 = self.d1
+                d2 = d1 - self.sigma * math.sqrt(self.T)
+                return self.K * math.exp(-self.r * self.T) * _norm_cdf(-d2) - self.S * math.exp(
+                    -self.q * self.T
+                ) * _norm_cdf(-d1)
+            except (ArithmeticError, ValueError):
+                return float(self._as_arrays().put_price())
         return self.K * np.exp(-self.r * self.T) * norm.cdf(-self.d2) - self.S * np.exp(-self.q * self.T) * norm.cdf(
             -self.d1
         )
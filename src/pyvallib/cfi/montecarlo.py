@@ -1,5 +1,12 @@
+import time
+
 import numpy as np
 
+from ..profiling import instrument
+
+# Broadie-Glasserman-Kou continuity correction constant, -zeta(1/2) / sqrt(2 * pi)
+BGK_BETA = 0.5825971579390107
+
 
 class MonteCarlo:
     """
@@ -56,14 +63,226 @@ class MonteCarlo:
     def dt(self):
         return np.diff(self.T, prepend=0)
 
-    def generate_paths(self):
+    @instrument("montecarlo.standard_normals")
+    def standard_normals(self):
+        """Shape-(nxM) array of standard normal draws from the seeded random number generator"""
         rng = np.random.default_rng(seed=self.seed)
+        return rng.standard_normal(size=(self.n, self.M))
+
+    @instrument("montecarlo.generate_paths")
+    def generate_paths(self, normals: np.ndarray | None = None):
+        """
+        Generate simulation paths.
+
+        Parameters:
+        normals: The shape-(nxM) array of standard normal draws to reuse (default draws from standard_normals)
+        """
+        if normals is None:
+            normals = self.standard_normals()
+        return self._simulate(normals, self.S, self.sigma, self.r)
 
-        drift = ((self.r - self.q) - (self.sigma**2) / 2) * self.dt
+    def _simulate(self, normals, S, sigma, r):
+        """Simulation paths from the given normal draws with S, sigma and r overridden"""
+        drift = ((r - self.q) - (sigma**2) / 2) * self.dt
 
-        dw = self.sigma * rng.standard_normal(size=(self.n, self.M))
+        dw = sigma * normals
         factor = np.multiply(np.sqrt(self.dt), dw)
 
-        return np.multiply(self.S, np.exp(np.cumsum(drift + factor, axis=1)))
+        return np.multiply(S, np.exp(np.cumsum(drift + factor, axis=1)))
+
+    @instrument("montecarlo.barrier_survival")
+    def barrier_survival(
+        self,
+        paths: np.ndarray,
+        barrier: np.ndarray | float,
+        direction: str = "down",
+        monitoring_dt: float | None = None,
+    ):
+        """
+        Probability that each path has not breached the barrier by each simulation step.
+
+        Between consecutive simulation steps the log price is a Brownian bridge, so the probability of crossing the
+        barrier within a step is exp(-2 * (x_0 - h) * (x_1 - h) / (sigma^2 * dt)) for log prices x_0, x_1 on the same
+        side of the log barrier h (and 1 otherwise). This gives continuous monitoring accuracy from a coarse grid.
+
+        For a barrier monitored discretely every monitoring_dt years, the barrier is shifted away from the spot by
+        exp(0.5826 * sigma * sqrt(monitoring_dt)) per Broadie-Glasserman-Kou before applying the bridge.
+
+        Parameters:
+        paths: The shape-(nxM) array of simulation paths from generate_paths
+        barrier: The barrier level (scalar or 1xM array for a barrier changing at each simulation step)
+        direction: 'down' for a barrier below the spot price or 'up' for a barrier above it (default is 'down')
+        monitoring_dt: The time between barrier observations for discrete monitoring (default is continuous)
+
+        Returns a shape-(nxM) array. Knock-out payoffs at the last step are weighted by [:, -1] and knock-in payoffs
+        by 1 - [:, -1].
+        """
+        if direction not in ("down", "up"):
+            raise ValueError(f"Expected direction to be 'up' or 'down', got {direction!r}")
+        if self.S.size > 1:
+            raise ValueError("Barrier monitoring requires a scalar spot price S")
+        sign = 1 if direction == "down" else -1
+
+        log_barrier = np.log(np.broadcast_to(np.atleast_2d(barrier), (1, self.M)))
+        if monitoring_dt is not None:
+            log_barrier = log_barrier - sign * BGK_BETA * self.sigma * np.sqrt(monitoring_dt)
+
+        log_paths = np.log(paths)
+        distance = sign * (log_paths - log_barrier)
+        distance_prev = np.empty_like(distance)
+        distance_prev[:, 0] = sign * (np.log(self.S[0, 0]) - log_barrier[:, 0])
+        distance_prev[:, 1:] = sign * (log_paths[:, :-1] - log_barrier[:, 1:])
+
+        with np.errstate(divide="ignore", over="ignore"):
+            cross_prob = np.exp(-2 * distance_prev * distance / (self.sigma**2 * self.dt))
+        cross_prob[(distance_prev <= 0) | (distance <= 0)] = 1
+
+        return np.cumprod(1 - cross_prob, axis=1)
+
+    @instrument("montecarlo.greeks")
+    def greeks(self, payoff, payoff_grad=None, method: str = "pathwise", bump: float = 0.01):
+        """
+        Estimates the price, delta, vega and rho of a payoff paid at the last simulation step from one set of normal
+        draws.
+
+        Parameters:
+        payoff: Function mapping the shape-(nxM) array of simulation paths to the shape-(n) array of payoffs
+        payoff_grad: Function mapping the simulation paths to the shape-(nxM) array of derivatives of the payoff with
+            respect to each path value (required for the pathwise method)
+        method: The estimator used for the greeks (default is 'pathwise')
+            'pathwise': differentiates each path, for payoffs that are continuous in the path (e.g. calls, puts)
+            'likelihood_ratio': weights payoffs by the score of the path density, for discontinuous payoffs
+                (e.g. digitals)
+            'bump': central differences repricing with the same normal draws (common random numbers)
+        bump: The bump size for the 'bump' method, relative to S and absolute for sigma and r (default is 0.01)
+
+        Returns a dictionary of the price and greeks and a dictionary of their standard errors.
+        """
+        if self.S.size > 1:
+            raise ValueError("Greeks require a scalar spot price S")
+
+        normals = self.standard_normals()
+        paths = self._simulate(normals, self.S, self.sigma, self.r)
+        S, T = self.S[0, 0], self.T[0, -1]
+        price = np.exp(-self.r * T) * payoff(paths)
+
+        if method == "pathwise":
+            if payoff_grad is None:
+                raise ValueError("Expected payoff_grad for pathwise greeks")
+            # Derivative of payoff with respect to log path values, discounted
+            grad = np.exp(-self.r * T) * payoff_grad(paths) * paths
+            brownian = np.cumsum(np.sqrt(self.dt) * normals, axis=1)
+            estimates = {
+                "delta": grad.sum(axis=1) / S,
+                "vega": (grad * (brownian - self.sigma * self.T)).sum(axis=1),
+                "rho": (grad * self.T).sum(axis=1) - T * price,
+            }
+
+        elif method == "likelihood_ratio":
+            if self.sigma <= 0 or self.dt[0, 0] <= 0:
+                raise ValueError("Likelihood ratio greeks require sigma and the first time step to be greater than 0")
+            scaled_normals = np.sqrt(self.dt) * normals
+            estimates = {
+                "delta": price * normals[:, 0] / (S * self.sigma * np.sqrt(self.dt[0, 0])),
+                "vega": price * ((normals**2 - 1) / self.sigma - scaled_normals).sum(axis=1),
+                "rho": price * (scaled_normals.sum(axis=1) / self.sigma - T),
+            }
+
+        elif method == "bump":
+
+            def reprice(S=S, sigma=self.sigma, r=self.r):
+                return np.exp(-r * T) * payoff(self._simulate(normals, S, sigma, r))
+
+            h = bump * S
+            estimates = {
+                "delta": (reprice(S=S + h) - reprice(S=S - h)) / (2 * h),
+                "vega": (reprice(sigma=self.sigma + bump) - reprice(sigma=self.sigma - bump)) / (2 * bump),
+                "rho": (reprice(r=self.r + bump) - reprice(r=self.r - bump)) / (2 * bump),
+            }
+
+        else:
+            raise ValueError(f"Expected method to be 'pathwise', 'likelihood_ratio' or 'bump', got {method!r}")
+
+        estimates = {"price": price, **estimates}
+        return {
+            "greeks": {key: value.mean() for key, value in estimates.items()},
+            "standard_error": {key: value.std() / np.sqrt(self.n) for key, value in estimates.items()},
+        }
+
+    @instrument("montecarlo.price_adaptive")
+    def price_adaptive(
+        self,
+        payoff,
+        abs_tol: float | None = None,
+        rel_tol: float | None = None,
+        max_paths: int = 10_000_000,
+        time_budget: float | None = None,
+        batch_size: int | None = None,
+    ):
+        """
+        Prices a payoff paid at the last simulation step, simulating batches of paths until the standard error of the
+        price meets the tolerance, the path cap is reached or the time budget is spent.
+
+        Batch k draws from the k-th child of the seed, so results are reproducible for a given seed, tolerance and batch
+        size (stopping on the time budget depends on the machine).
+
+        Parameters:
+        payoff: Function mapping the shape-(nxM) array of simulation paths to the shape-(n) array of payoffs
+        abs_tol: The target standard error of the price
+        rel_tol: The target standard error of the price relative to the price
+        max_paths: The maximum number of simulation paths (default is 10,000,000)
+        time_budget: The number of seconds after which no further batch is started
+        batch_size: The number of simulation paths per batch (default is n)
+
+        Returns a dictionary of the price, standard error, number of paths and batches used, elapsed seconds and the
+        reason the simulation stopped ('tolerance', 'max_paths' or 'time_budget'). At least one of abs_tol, rel_tol
+        and time_budget must be given.
+        """
+        if abs_tol is None and rel_tol is None and time_budget is None:
+            raise ValueError("Expected at least one of abs_tol, rel_tol, time_budget to be given")
+        if max_paths < 1:
+            raise ValueError("Expected max_paths to be at least 1")
+
+        batch_size = int(batch_size or self.n)
+        seed_sequence = np.random.SeedSequence(self.seed)
+        discount = np.exp(-self.r * self.T[0, -1])
+
+        start = time.perf_counter()
+        count, mean, m2, n_batches = 0, 0.0, 0.0, 0
+        while True:
+            size = min(batch_size, max_paths - count)
+            rng = np.random.default_rng(seed_sequence.spawn(1)[0])
+            normals = rng.standard_normal(size=(size, self.M))
+            values = discount * payoff(self._simulate(normals, self.S, self.sigma, self.r))
+
+            # Combine running mean and sum of squared deviations with the batch (Chan et al.)
+            batch_mean = values.mean()
+            delta = batch_mean - mean
+            total = count + size
+            mean += delta * size / total
+            m2 += ((values - batch_mean) ** 2).sum() + delta**2 * count * size / total
+            count = total
+            n_batches += 1
+
+            standard_error = np.sqrt(m2 / (count - 1) / count) if count > 1 else np.inf
+            tolerance = max(abs_tol or 0, (rel_tol or 0) * abs(mean))
+            if (abs_tol is not None or rel_tol is not None) and standard_error <= tolerance:
+                stop_reason = "tolerance"
+                break
+            if count >= max_paths:
+                stop_reason = "max_paths"
+                break
+            if time_budget is not None and time.perf_counter() - start >= time_budget:
+                stop_reason = "time_budget"
+                break
+
+        return {
+            "price": mean,
+            "standard_error": standard_error,
+            "n_paths": count,
+            "n_batches": n_batches,
+            "elapsed": time.perf_counter() - start,
+            "stop_reason": stop_reason,
+        }
 
     citation = "Boyle, P. (1977) 'Options: A Monte Carlo Approach', Journal of Financial Economics, 4, pp. 323-338."
@@ -0,0 +1,130 @@
+import numpy as np
+from scipy.optimize import brentq
+from scipy.special import ndtr
+
+from .blackscholes import BlackScholes
+
+
+class OPM:
+    """
+    Option Pricing Method for allocating equity value to the share classes of a cap table with the given parameters.
+
+    Parameters:
+    breakpoints: The equity values at which each tranche of the waterfall begins (ascending, the first is usually 0)
+    participation: The shape-(BxC) array of the fraction of each tranche allocated to each share class where:
+        B is the number of breakpoints
+        C is the number of share classes
+    shares: The number of shares in each share class
+    T: The time to liquidity event (in years)
+    sigma: The volatility of equity
+    r: The risk-free interest rate
+    q: The continuous dividend yield (default is 0)
+
+    Each tranche is valued as a call spread on equity between consecutive breakpoints (the last tranche as a call),
+    with all breakpoint calls priced in a single Black-Scholes evaluation. T, sigma, r, q may also be arrays with the
+    same shape as the equity values being allocated to value several scenarios at once.
+    """
+
+    def __init__(self, breakpoints, participation, shares, T, sigma, r, q=0.0):
+        self.breakpoints = np.asarray(breakpoints, dtype=float)
+        self.participation = np.asarray(participation, dtype=float)
+        self.shares = np.asarray(shares, dtype=float)
+
+        if self.breakpoints.ndim != 1 or (self.breakpoints < 0).any() or (np.diff(self.breakpoints) <= 0).any():
+            raise ValueError("Expected breakpoints to be a 1-d array of increasing values greater than or equal to 0")
+        if self.participation.shape != (self.breakpoints.size, self.shares.size):
+            raise ValueError("Expected participation to have shape (number of breakpoints, number of share classes)")
+        if not np.allclose(self.participation.sum(axis=1), 1):
+            raise ValueError("Expected participation in each tranche to sum to 1")
+        if any((np.asarray(x) <= 0).any() for x in (T, sigma, r)):
+            raise ValueError("Expected inputs T, sigma, rfr to be greater than 0")
+
+        self.T = T
+        self.sigma = sigma
+        self.r = r
+        self.q = q
+
+    def call_strip(self, equity):
+        """
+        Calculates the call value at each breakpoint, shape-(...xB) for equity values of shape (...)
+        """
+        inputs = [np.asarray(x, dtype=float)[..., None] for x in (equity, self.T, self.sigma, self.r, self.q)]
+        S, K, T, sigma, r, q = np.broadcast_arrays(inputs[0], self.breakpoints, *inputs[1:])
+        with np.errstate(divide="ignore"):
+            return BlackScholes(S, K, T, sigma, r, q).call_price()
+
+    def tranche_values(self, equity):
+        """
+        Calculates the value of each tranche between consecutive breakpoints, shape-(...xB)
+        """
+        strip = self.call_strip(equity)
+        tranches = strip.copy()
+        tranches[..., :-1] -= strip[..., 1:]
+        return tranches
+
+    def allocate(self, equity):
+        """
+        Calculates the value allocated to each share class, shape-(...xC) for equity values of shape (...)
+        """
+        return self.tranche_values(equity) @ self.participation
+
+    def value_per_share(self, equity):
+        """
+        Calculates the value per share of each share class, shape-(...xC) for equity values of shape (...)
+        """
+        return self.allocate(equity) / self.shares
+
+    def backsolve(self, price, share_class, bracket=None, xtol=1e-6):
+        """
+        Solves for the equity value at which the value per share of a share class equals the given price.
+
+        Parameters:
+        price: The value per share of the share class, e.g. the price of a recent financing round
+        share_class: The index of the share class
+        bracket: The (lower, upper) equity values bracketing the solution (default is found by doubling from the
+            total value of the share class at the given price)
+        xtol: The absolute tolerance of the solved equity value
+        """
+        if any(np.ndim(x) > 0 for x in (self.T, self.sigma, self.r, self.q)):
+            raise ValueError("Backsolve requires scalar inputs T, sigma, r, q")
+        strip = self._backsolve_strip()
+        class_participation = self.participation[:, share_class] / self.shares[share_class]
+
+        def excess_value(equity):
+            tranches = strip(equity)
+            tranches[:-1] -= tranches[1:]
+            return tranches @ class_participation - price
+
+        if bracket is None:
+            lower = upper = price * self.shares[share_class]
+            for _ in range(100):
+                if excess_value(upper) >= 0:
+                    break
+                lower, upper = upper, 2 * upper
+            else:
+                raise ValueError("Could not bracket the equity value, check the share class participates in equity")
+            bracket = (lower, upper)
+
+        return brentq(excess_value, *bracket, xtol=xtol)
+
+    def _backsolve_strip(self):
+        """
+        Returns a function of a scalar equity value giving the same call strip as call_strip, with the terms
+        independent of equity value computed once to be reused in every solver iteration
+        """
+        vol = self.sigma * np.sqrt(self.T)
+        with np.errstate(divide="ignore"):
+            log_k = np.log(self.breakpoints) - (self.r - self.q + 0.5 * self.sigma**2) * self.T
+        discounted_k = self.breakpoints * np.exp(-self.r * self.T)
+        dividend_factor = np.exp(-self.q * self.T)
+
+        def strip(equity):
+            d1 = (np.log(equity) - log_k) / vol
+            return equity * dividend_factor * ndtr(d1) - discounted_k * ndtr(d1 - vol)
+
+        return strip
+
+    citation = (
+        "AICPA (2013) 'Valuation of Privately-Held-Company Equity Securities Issued as Compensation', "
+        "Accounting and Valuation Guide, Chapter 6."
+    )
@@ -0,0 +1,243 @@
+"""
+Module for valuing a portfolio of instruments across the valuation models
+
+Rows are grouped by model. Models that accept array inputs are priced in a single vectorized call per group, while
+lattice and simulation models are priced row by row across a process pool.
+"""
+
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .cfi.binomial import BinomialAmerican
+from .cfi.blackscholes import BlackScholes
+from .cfi.montecarlo import MonteCarlo
+from .dlom.chaffe import Chaffe
+from .dlom.differential_put import DifferentialPut
+from .dlom.finnerty import Finnerty
+from .dlom.ghaidarov import Ghaidarov
+
+# Required and optional (with defaults) input columns for each model
+MODEL_PARAMETERS = {
+    "BlackScholes": (["S", "K", "T", "sigma", "r"], {"q": 0.0}),
+    "BinomialAmerican": (["S", "K", "T", "sigma", "r", "M"], {"q": 0.0}),
+    "MonteCarlo": (["S", "K", "T", "sigma", "r", "n"], {"q": 0.0, "seed": 6302024}),
+    "Chaffe": (["T", "sigma", "r"], {"q": 0.0}),
+    "DifferentialPut": (["T", "sigma_preferred", "sigma_common", "r"], {"q": 0.0}),
+    "Finnerty": (["T", "sigma"], {"q": 0.0}),
+    "Ghaidarov": (["T", "sigma"], {"q": 0.0}),
+}
+OPTION_MODELS = {"BlackScholes", "BinomialAmerican", "MonteCarlo"}
+VECTORIZED_MODELS = {"BlackScholes", "Chaffe", "DifferentialPut"}
+PARALLEL_MODELS = {"BinomialAmerican", "MonteCarlo"}
+INTEGER_PARAMETERS = {"M", "n", "seed"}
+
+
+def _option_price(instrument, option_type):
+    if option_type == "call":
+        return instrument.call_price()
+    if option_type == "put":
+        return instrument.put_price()
+    raise ValueError(f"Expected option_type to be 'call' or 'put', got {option_type!r}")
+
+
+def _montecarlo_price(S, K, T, sigma, r, n, q, seed, option_type):
+    """European option price at maturity T from simulated terminal prices"""
+    terminal = MonteCarlo(S, T, sigma, r, n, q, seed).generate_paths()[:, -1]
+    if option_type == "call":
+        payoff = np.maximum(terminal - K, 0)
+    elif option_type == "put":
+        payoff = np.maximum(K - terminal, 0)
+    else:
+        raise ValueError(f"Expected option_type to be 'call' or 'put', got {option_type!r}")
+    return np.exp(-r * T) * payoff.mean()
+
+
+def parse_instrument(model, record):
+    """
+    Extract the inputs of a model from a record, filling in defaults for missing optional inputs.
+
+    Parameters:
+    model: The name of the model (a key of MODEL_PARAMETERS)
+    record: Dictionary of inputs, which may contain keys not used by the model
+
+    Returns the model inputs keyed by parameter name and the option type ('call' or 'put' for option models, None
+    otherwise).
+    """
+    if model not in MODEL_PARAMETERS:
+        raise ValueError(f"Unknown model {model!r}")
+
+    required, optional = MODEL_PARAMETERS[model]
+    missing = [key for key in required if pd.isna(record.get(key, np.nan))]
+    if missing:
+        raise ValueError(f"Missing inputs {missing} for {model}")
+
+    params = {key: record[key] for key in required}
+    params.update(
+        {key: default if pd.isna(record.get(key, np.nan)) else record[key] for key, default in optional.items()}
+    )
+    params = {key: int(value) if key in INTEGER_PARAMETERS else float(value) for key, value in params.items()}
+
+    option_type = None
+    if model in OPTION_MODELS:
+        option_type = record.get("option_type", "call")
+        option_type = "call" if pd.isna(option_type) else str(option_type).lower()
+    return params, option_type
+
+
+def price_instrument(model, params, option_type="call"):
+    """
+    Price a single instrument.
+
+    Parameters:
+    model: The name of the model (a key of MODEL_PARAMETERS)
+    params: The model inputs keyed by parameter name
+    option_type: 'call' or 'put' for option models (default is 'call')
+    """
+    if model == "BlackScholes":
+        return _option_price(BlackScholes(**params), option_type)
+    if model == "BinomialAmerican":
+        return _option_price(BinomialAmerican(**params), option_type)
+    if model == "MonteCarlo":
+        return _montecarlo_price(**params, option_type=option_type)
+    if model == "Chaffe":
+        return Chaffe(**params).calculate_dlom()
+    if model == "DifferentialPut":
+        return DifferentialPut(**params).calculate_dlom()
+    if model == "Finnerty":
+        return Finnerty(**params).calculate_dlom()
+    if model == "Ghaidarov":
+        return Ghaidarov(**params).calculate_dlom()
+    raise ValueError(f"Unknown model {model!r}, expected one of {sorted(MODEL_PARAMETERS)}")
+
+
+def price_rows(model, rows):
+    """
+    Price rows one at a time, capturing the error and timing of each row.
+
+    Parameters:
+    model: The name of the model (a key of MODEL_PARAMETERS)
+    rows: List of (position, params, option_type) tuples, with params and option_type as from parse_instrument
+
+    Returns a list of (position, value, error, elapsed) tuples, where value is NaN and error is the exception message
+    for rows that could not be priced (error is None otherwise).
+    """
+    results = []
+    for position, params, option_type in rows:
+        start = time.perf_counter()
+        try:
+            value, error = float(price_instrument(model, params, option_type)), None
+        except Exception as e:
+            value, error = np.nan, f"{type(e).__name__}: {e}"
+        results.append((position, value, error, time.perf_counter() - start))
+    return results
+
+
+def price_batch(model, rows):
+    """
+    Price rows in a single vectorized call, falling back to row by row pricing if the batch raises so that the
+    offending rows can be identified. The elapsed time of the batch is split evenly across its rows.
+
+    Parameters:
+    model: The name of a model accepting array inputs (a member of VECTORIZED_MODELS)
+    rows: List of (position, params, option_type) tuples sharing the same option_type
+
+    Returns a list of (position, value, error, elapsed) tuples as price_rows.
+    """
+    start = time.perf_counter()
+    params = {key: np.array([row[1][key] for row in rows], dtype=float) for key in rows[0][1]}
+    try:
+        values = np.broadcast_to(price_instrument(model, params, rows[0][2]), len(rows))
+    except Exception:
+        return price_rows(model, rows)
+    elapsed = (time.perf_counter() - start) / len(rows)
+    return [(row[0], float(value), None, elapsed) for row, value in zip(rows, values)]
+
+
+class Portfolio:
+    """
+    Values a table of instruments priced with different models.
+
+    Parameters:
+    instruments: DataFrame with one row per instrument, a column naming the model of each row and a column for each
+        model input (see MODEL_PARAMETERS). Option models also read an 'option_type' column ('call' or 'put', default
+        is 'call'). Inputs not used by a row's model may be missing or NaN.
+    max_workers: The number of processes used for lattice and simulation models (default is the number of CPUs, 1
+        prices all rows in the current process)
+    chunksize: The number of rows sent to a process at a time (default splits each model group into about four chunks
+        per worker)
+    model_column: The name of the column naming the model (default is 'model')
+    """
+
+    def __init__(
+        self,
+        instruments: pd.DataFrame,
+        max_workers: int | None = None,
+        chunksize: int | None = None,
+        model_column: str = "model",
+    ):
+        if model_column not in instruments.columns:
+            raise ValueError(f"Expected instruments to have a '{model_column}' column")
+        self.instruments = instruments
+        self.max_workers = max_workers
+        self.chunksize = chunksize
+        self.model_column = model_column
+
+    def _group_rows(self):
+        """
+        Split rows into per-model groups of (position, params, option_type), and errors for rows that cannot be priced
+        """
+        groups = {}
+        errors = []
+        records = self.instruments.to_dict("records")
+        for position, record in enumerate(records):
+            model = record[self.model_column]
+            try:
+                params, option_type = parse_instrument(model, record)
+            except Exception as e:
+                errors.append((position, np.nan, f"{type(e).__name__}: {e}", 0.0))
+                continue
+            groups.setdefault((model, option_type), []).append((position, params, option_type))
+        return groups, errors
+
+    def value(self):
+        """
+        Value all instruments.
+
+        Returns a DataFrame in the original row order with the model, value, error message (None if the row was
+        priced) and elapsed seconds of each row.
+        """
+        groups, results = self._group_rows()
+
+        parallel = []
+        for (model, _), rows in groups.items():
+            if model in VECTORIZED_MODELS:
+                results.extend(price_batch(model, rows))
+            elif model in PARALLEL_MODELS:
+                parallel.append((model, rows))
+            else:
+                results.extend(price_rows(model, rows))
+
+        if parallel and self.max_workers != 1:
+            workers = self.max_workers or os.cpu_count() or 1
+            with ProcessPoolExecutor(workers) as executor:
+                futures = []
+                for model, rows in parallel:
+                    chunksize = self.chunksize or math.ceil(len(rows) / (4 * workers))
+                    for i in range(0, len(rows), chunksize):
+                        futures.append(executor.submit(price_rows, model, rows[i : i + chunksize]))
+                for future in futures:
+                    results.extend(future.result())
+        else:
+            for model, rows in parallel:
+                results.extend(price_rows(model, rows))
+
+        results = pd.DataFrame(results, columns=["position", "value", "error", "elapsed"]).set_index("position")
+        results = results.reindex(range(len(self.instruments)))
+        results.insert(0, "model", self.instruments[self.model_column].to_numpy())
+        results.index = self.instruments.index
+        return results
@@ -0,0 +1,182 @@
+"""
+Module for opt-in instrumentation of the valuation models
+
+Instrumented functions record their wall time, the size of the arrays they return and their position in the call
+stack while a profiler is active. When no profiler is active an instrumented function only performs a single check
+before calling through, so instrumentation can stay in place in production code.
+
+Example:
+with profile() as profiler:
+    BinomialAmerican(10, 10, 5, 0.45, 0.05, 1000).put_price()
+profiler.summary()
+"""
+
+import functools
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+
+import numpy as np
+
+_profilers = []
+_local = threading.local()
+
+
+@dataclass
+class PhaseRecord:
+    """
+    Timing record for a single call of an instrumented phase.
+
+    Parameters:
+    phase: The name of the instrumented phase
+    start: The wall clock time the phase started (seconds since epoch)
+    elapsed: The wall time spent in the phase including nested phases (seconds)
+    self_elapsed: The wall time spent in the phase excluding nested phases (seconds)
+    nbytes: The total size of the arrays returned by the phase (bytes)
+    shape: The shape of the array returned by the phase (None if it did not return a single array)
+    depth: The nesting depth of the phase (0 for outermost phases)
+    parent: The name of the enclosing phase (None for outermost phases)
+    """
+
+    phase: str
+    start: float
+    elapsed: float
+    self_elapsed: float
+    nbytes: int
+    shape: tuple | None
+    depth: int
+    parent: str | None
+
+
+class Profiler:
+    """
+    Collects phase records from instrumented functions while active.
+    """
+
+    def __init__(self):
+        self.records = []
+
+    def summary(self):
+        """
+        Aggregate records by phase into call counts, total and self timings and allocation sizes.
+        """
+        summary = {}
+        for record in self.records:
+            stats = summary.setdefault(
+                record.phase, {"calls": 0, "total": 0.0, "self": 0.0, "max": 0.0, "nbytes": 0, "max_nbytes": 0}
+            )
+            stats["calls"] += 1
+            stats["total"] += record.elapsed
+            stats["self"] += record.self_elapsed
+            stats["max"] = max(stats["max"], record.elapsed)
+            stats["nbytes"] += record.nbytes
+            stats["max_nbytes"] = max(stats["max_nbytes"], record.nbytes)
+        for stats in summary.values():
+            stats["mean"] = stats["total"] / stats["calls"]
+        return summary
+
+    def to_records(self):
+        """
+        Records as a list of plain dictionaries, suitable for serialization to a metrics pipeline.
+        """
+        return [asdict(record) for record in self.records]
+
+    def clear(self):
+        self.records = []
+
+
+def _stack():
+    if not hasattr(_local, "stack"):
+        _local.stack = []
+    return _local.stack
+
+
+def _nbytes(result):
+    """Total size and shape of the arrays in a phase result"""
+    if isinstance(result, np.ndarray):
+        return result.nbytes, result.shape
+    if isinstance(result, (tuple, list)):
+        return sum(x.nbytes for x in result if isinstance(x, np.ndarray)), None
+    return 0, None
+
+
+@contextmanager
+def _record(name):
+    stack = _stack()
+    frame = {"name": name, "children": 0.0, "result": None}
+    start_time = time.time()
+    start = time.perf_counter()
+    stack.append(frame)
+    try:
+        yield frame
+    finally:
+        elapsed = time.perf_counter() - start
+        stack.pop()
+        if stack:
+            stack[-1]["children"] += elapsed
+        nbytes, shape = _nbytes(frame["result"])
+        record = PhaseRecord(
+            phase=name,
+            start=start_time,
+            elapsed=elapsed,
+            self_elapsed=elapsed - frame["children"],
+            nbytes=nbytes,
+            shape=shape,
+            depth=len(stack),
+            parent=stack[-1]["name"] if stack else None,
+        )
+        for profiler in _profilers:
+            profiler.records.append(record)
+
+
+def instrument(name):
+    """
+    Decorator recording each call of the decorated function as a phase while a profiler is active.
+
+    Parameters:
+    name: The name of the phase
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _profilers:
+                return func(*args, **kwargs)
+            with _record(name) as frame:
+                frame["result"] = func(*args, **kwargs)
+            return frame["result"]
+
+        return wrapper
+
+    return decorator
+
+
+@contextmanager
+def phase(name):
+    """
+    Context manager recording the enclosed block as a phase while a profiler is active, e.g. a payoff evaluation.
+
+    Parameters:
+    name: The name of the phase
+    """
+    if not _profilers:
+        yield
+        return
+    with _record(name):
+        yield
+
+
+@contextmanager
+def profile():
+    """
+    Context manager activating a profiler for the enclosed block.
+
+    Yields the Profiler collecting the phase records.
+    """
+    profiler = Profiler()
+    _profilers.append(profiler)
+    try:
+        yield profiler
+    finally:
+        _profilers.remove(profiler)
@@ -5,7 +5,10 @@ models
 
 import pandas as pd
 
+from ..profiling import instrument
 
+
+@instrument("pv.yearfrac")
 def yearfrac(start_date: pd.Timestamp, end_date: pd.Timestamp, basis=0):
     """Calculates time between two dates.
 
@@ -0,0 +1,273 @@
+"""
+Module for serving pricing requests from a local HTTP server
+
+Concurrent requests to the same endpoint that arrive within a short window are coalesced into a single batch, priced
+with one vectorized call where the model accepts array inputs, and the results fanned back out to each request.
+
+Endpoints (POST with a JSON object of model inputs, see portfolio.MODEL_PARAMETERS):
+/blackscholes            S, K, T, sigma, r, q (optional), option_type ('call' or 'put', default is 'call')
+/dlom/chaffe             T, sigma, r, q (optional)
+/dlom/differential_put   T, sigma_preferred, sigma_common, r, q (optional)
+/dlom/finnerty           T, sigma, q (optional)
+/dlom/ghaidarov          T, sigma, q (optional)
+/yearfrac                start_date, end_date, basis (optional)
+
+Responses are {"value": ...} with status 200, or {"error": ...} with status 400 for invalid requests (including
+inputs without a finite result) and 500 for unexpected failures.
+
+Usage:
+python -m pyvallib.service --port 8080 --window 0.002
+"""
+
+import argparse
+import asyncio
+import json
+import math
+from functools import partial
+
+import pandas as pd
+
+from .portfolio import VECTORIZED_MODELS, parse_instrument, price_batch, price_rows
+from .pv.yearfrac import yearfrac
+
+ENDPOINTS = {
+    "/blackscholes": "BlackScholes",
+    "/dlom/chaffe": "Chaffe",
+    "/dlom/differential_put": "DifferentialPut",
+    "/dlom/finnerty": "Finnerty",
+    "/dlom/ghaidarov": "Ghaidarov",
+    "/yearfrac": "yearfrac",
+}
+STATUS_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    500: "Internal Server Error",
+}
+
+
+class MicroBatcher:
+    """
+    Coalesces concurrent requests into batches evaluated with a single call.
+
+    Parameters:
+    func: Function mapping a list of requests to a list of results in the same order, where a result may be an
+        exception raised for that request only
+    window: The number of seconds to wait for more requests after the first request of a batch (default is 0.002)
+    max_batch: The maximum number of requests in a batch (default is 1024)
+    """
+
+    def __init__(self, func, window: float = 0.002, max_batch: int = 1024):
+        self.func = func
+        self.window = window
+        self.max_batch = max_batch
+        self._pending = []
+        self._timer = None
+
+    async def submit(self, request):
+        """
+        Add a request to the current batch and wait for its result.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((request, future))
+        if len(self._pending) >= self.max_batch:
+            self.flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self.flush)
+        return await future
+
+    def flush(self):
+        """
+        Evaluate all pending requests as a single batch.
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        try:
+            results = self.func([request for request, _ in batch])
+        except Exception as e:
+            results = [e] * len(batch)
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+def price_requests(model, requests):
+    """
+    Price a batch of requests for a model, returning a value or ValueError for each request so that an invalid request
+    does not affect the others in the batch.
+
+    Requests are grouped by option type and priced with a single vectorized call per group where the model accepts
+    array inputs.
+    """
+    results = [None] * len(requests)
+    groups = {}
+    for position, request in enumerate(requests):
+        try:
+            params, option_type = parse_instrument(model, request)
+        except Exception as e:
+            results[position] = ValueError(str(e))
+            continue
+        groups.setdefault(option_type, []).append((position, params, option_type))
+
+    for rows in groups.values():
+        priced = price_batch(model, rows) if model in VECTORIZED_MODELS else price_rows(model, rows)
+        for position, value, error, _ in priced:
+            results[position] = value if error is None else ValueError(error)
+    return results
+
+
+def yearfrac_batch(requests):
+    """
+    Calculate yearfrac for a batch of requests, returning a value or ValueError for each request so that an invalid
+    request does not affect the others in the batch.
+    """
+    results = []
+    for request in requests:
+        try:
+            start_date, end_date = pd.Timestamp(request["start_date"]), pd.Timestamp(request["end_date"])
+            results.append(yearfrac(start_date, end_date, int(request.get("basis", 0))))
+        except Exception as e:
+            results.append(ValueError(f"{type(e).__name__}: {e}"))
+    return results
+
+
+class PricingService:
+    """
+    Local HTTP pricing server with request micro-batching.
+
+    Parameters:
+    host: The host to bind (default is '127.0.0.1')
+    port: The port to bind (default is 8080, 0 binds a free port)
+    window: The number of seconds to wait for more requests to batch (default is 0.002)
+    max_batch: The maximum number of requests in a batch (default is 1024)
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8080, window: float = 0.002, max_batch: int = 1024):
+        self.host = host
+        self.port = port
+        self.batchers = {}
+        for path, model in ENDPOINTS.items():
+            func = yearfrac_batch if model == "yearfrac" else partial(price_requests, model)
+            self.batchers[path] = MicroBatcher(func, window, max_batch)
+        self.server = None
+
+    async def start(self):
+        """
+        Start listening, updating port to the bound port.
+        """
+        self.server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self.server
+
+    async def serve_forever(self):
+        if self.server is None:
+            await self.start()
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def close(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def _handle_connection(self, reader, writer):
+        """
+        Serve HTTP/1.1 requests on a connection until the client closes it.
+        """
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                headers = {}
+                while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    key, _, value = line.decode("latin-1").partition(":")
+                    headers[key.strip().lower()] = value.strip()
+
+                try:
+                    method, path, _ = request_line.decode("latin-1").split(" ", 2)
+                    content_length = int(headers.get("content-length", 0))
+                    if content_length < 0:
+                        raise ValueError(content_length)
+                except ValueError:
+                    # Without a request line or body length the next request cannot be found, so close after replying
+                    await self._write_response(writer, 400, {"error": "Malformed HTTP request"})
+                    break
+                body = await reader.readexactly(content_length)
+
+                status, response = await self._respond(method, path, body)
+                await self._write_response(writer, status, response)
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _write_response(writer, status, response):
+        payload = json.dumps(response, allow_nan=False).encode()
+        writer.write(
+            f"HTTP/1.1 {status} {STATUS_REASONS[status]}\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(payload)}\r\n\r\n".encode("latin-1") + payload
+        )
+        await writer.drain()
+
+    async def _respond(self, method, path, body):
+        if path == "/health":
+            return 200, {"status": "ok"}
+        if path not in self.batchers:
+            return 404, {"error": f"Unknown endpoint {path}, expected one of {sorted(self.batchers)}"}
+        if method != "POST":
+            return 405, {"error": "Expected POST request"}
+
+        try:
+            request = json.loads(body)
+            if not isinstance(request, dict):
+                raise ValueError("Expected request body to be a JSON object")
+            value = await self.batchers[path].submit(request)
+        except ValueError as e:
+            return 400, {"error": str(e)}
+        except Exception as e:
+            return 500, {"error": f"{type(e).__name__}: {e}"}
+
+        # JSON has no representation of NaN or infinity
+        if not math.isfinite(value):
+            return 400, {"error": f"Inputs do not produce a finite result ({value})"}
+        return 200, {"value": value}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local pricing server with request micro-batching")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--window", type=float, default=0.002, help="seconds to wait for more requests to batch")
+    parser.add_argument("--max-batch", type=int, default=1024, help="maximum number of requests in a batch")
+    args = parser.parse_args()
+
+    service = PricingService(args.host, args.port, args.window, args.max_batch)
+
+    async def serve():
+        await service.start()
+        print(f"Serving on http://{service.host}:{service.port}", flush=True)
+        await service.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
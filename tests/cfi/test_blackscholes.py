@@ -1,3 +1,5 @@
+import math
+
 import numpy as np
 import pytest
 from pytest import param
@@ -75,3 +77,52 @@ def test_blackscholes_array(S, K, T, sigma, r, q, expected, error_message):
         with pytest.raises(ValueError) as e:
             BlackScholes(S, K, T, sigma, r, q)
         assert error_message in e.value.args[0]
+
+
+@pytest.mark.parametrize(
+    "S, K, T, sigma, r, q",
+    [
+        param(10.0, 10.0, 5.0, 0.45, 0.05, 0.0, id="test_normal_1"),
+        param(30, 25, 3, 0.20, 0.01, 0, id="test_normal_int"),
+        param(10.0, 15.0, 8.0, 0.90, 0.03, 0.01, id="test_normal_q"),
+        param(0.0, 10.0, 5.0, 0.45, 0.05, 0.0, id="test_w_$0_S"),
+        param(10.0, 0.0, 5.0, 0.45, 0.05, 0.0, id="test_w_$0_K"),
+        param(30.0, 25.0, 1e-6, 0.20, 0.01, 0.0, id="test_w_~0_T"),
+    ],
+)
+def test_blackscholes_scalar(S, K, T, sigma, r, q):
+    scalar = BlackScholes(S, K, T, sigma, r, q)
+    array = BlackScholes(*[np.asarray(x) for x in [S, K, T, sigma, r, q]])
+    assert scalar.scalar and not array.scalar
+    assert isinstance(scalar.call_price(), float)
+    assert scalar.call_price() == pytest.approx(array.call_price(), rel=1e-12, abs=1e-12)
+    assert scalar.put_price() == pytest.approx(array.put_price(), rel=1e-12, abs=1e-12)
+    assert BlackScholes(S, K, T, sigma, r, q, validate=False).call_price() == scalar.call_price()
+
+
+def test_blackscholes_skip_validation():
+    scalar = BlackScholes(10, 10, 5, 0.45, -0.05, validate=False)
+    array = BlackScholes(np.asarray(10), 10, 5, 0.45, -0.05, validate=False)
+    assert math.isfinite(scalar.call_price()) and math.isfinite(scalar.put_price())
+    assert scalar.call_price() == pytest.approx(array.call_price(), rel=1e-12)
+    assert scalar.put_price() == pytest.approx(array.put_price(), rel=1e-12)
+
+
+@pytest.mark.parametrize(
+    "S, K, T, sigma, r, q",
+    [
+        param(10.0, 10.0, 5.0, 0.45, 0.05, -1000.0, id="test_exp_overflow_q"),
+        param(-10.0, 10.0, 5.0, 0.45, 0.05, 0.0, id="test_<$0_S"),
+        param(10.0, -10.0, 5.0, 0.45, 0.05, 0.0, id="test_<$0_K"),
+        param(10.0, 10.0, 5.0, 0.0, 0.05, 0.0, id="test_w_0_sigma"),
+        param(10.0, 10.0, -5.0, 0.45, 0.05, 0.0, id="test_w_<0_T"),
+    ],
+)
+def test_blackscholes_scalar_out_of_range(S, K, T, sigma, r, q):
+    scalar = BlackScholes(S, K, T, sigma, r, q, validate=False)
+    array = BlackScholes(*[np.asarray(x) for x in [S, K, T, sigma, r, q]], validate=False)
+    with np.errstate(all="ignore"):
+        for method in ["d1", "d2"]:
+            np.testing.assert_equal(getattr(scalar, method), getattr(array, method))
+        np.testing.assert_equal(scalar.call_price(), array.call_price())
+        np.testing.assert_equal(scalar.put_price(), array.put_price())
@@ -84,3 +84,212 @@ def test_montecarlo_array(S, K, T, sigma, r, q, error_message):
         with pytest.raises(ValueError) as e:
             MonteCarlo(S, T, sigma, r, n)
         assert error_message in e.value.args[0]
+
+
+def analytical_barrier_call(S, K, H, T, sigma, r, q, barrier_type):
+    """
+    Continuously monitored down-and-out (H <= K) and up-and-in (H >= K) call prices
+    """
+    lam = (r - q + sigma**2 / 2) / sigma**2
+    vol = sigma * np.sqrt(T)
+    N = NormalDist().cdf
+    if barrier_type == "down-and-out":
+        y = np.log(H**2 / (S * K)) / vol + lam * vol
+        down_and_in = S * np.exp(-q * T) * (H / S) ** (2 * lam) * N(y) - K * np.exp(-r * T) * (H / S) ** (
+            2 * lam - 2
+        ) * N(y - vol)
+        return BlackScholes(S, K, T, sigma, r, q).call_price() - down_and_in
+
+    x1 = np.log(S / H) / vol + lam * vol
+    y = np.log(H**2 / (S * K)) / vol + lam * vol
+    y1 = np.log(H / S) / vol + lam * vol
+    return (
+        S * np.exp(-q * T) * N(x1)
+        - K * np.exp(-r * T) * N(x1 - vol)
+        - S * np.exp(-q * T) * (H / S) ** (2 * lam) * (N(-y) - N(-y1))
+        + K * np.exp(-r * T) * (H / S) ** (2 * lam - 2) * (N(-y + vol) - N(-y1 + vol))
+    )
+
+
+@pytest.mark.parametrize(
+    "S, K, H, T, sigma, r, q, M, barrier_type",
+    [
+        param(10, 10, 8, 1, 0.45, 0.05, 0, 1, "down-and-out", id="test_down_and_out_1_step"),
+        param(10, 10, 8, 1, 0.45, 0.05, 0, 4, "down-and-out", id="test_down_and_out_4_steps"),
+        param(30, 25, 27, 3, 0.20, 0.01, 0.01, 3, "down-and-out", id="test_down_and_out_q"),
+        param(10, 10, 13, 1, 0.45, 0.05, 0, 2, "up-and-in", id="test_up_and_in_2_steps"),
+    ],
+)
+def test_montecarlo_barrier(S, K, H, T, sigma, r, q, M, barrier_type):
+    mc = MonteCarlo(S, np.linspace(T / M, T, M), sigma, r, n / 5, q)
+    paths = mc.generate_paths()
+    survival = mc.barrier_survival(paths, H, "down" if barrier_type == "down-and-out" else "up")
+    weight = survival[:, -1] if barrier_type == "down-and-out" else 1 - survival[:, -1]
+    payoff_pv = np.exp(-r * T) * np.maximum(paths[:, -1] - K, 0) * weight
+
+    assert ((0 <= survival) & (survival <= 1)).all()
+    assert (np.diff(survival, axis=1) <= 0).all()
+    assert payoff_pv.mean() == pytest.approx(
+        analytical_barrier_call(S, K, H, T, sigma, r, q, barrier_type), abs=zscore * payoff_pv.std() / np.sqrt(mc.n)
+    )
+
+
+def test_montecarlo_barrier_discrete_monitoring():
+    # Monthly monitored down-and-out call: 2 steps with the BGK correction against 12 monitored steps
+    discrete_mc = MonteCarlo(10, np.linspace(1 / 12, 1, 12), 0.45, 0.05, n / 5)
+    discrete_paths = discrete_mc.generate_paths()
+    discrete_price = (
+        np.exp(-0.05) * np.maximum(discrete_paths[:, -1] - 10, 0) * (discrete_paths > 8).all(axis=1)
+    ).mean()
+
+    mc = MonteCarlo(10, [0.5, 1], 0.45, 0.05, n / 5)
+    paths = mc.generate_paths()
+    survival = mc.barrier_survival(paths, 8, "down", monitoring_dt=1 / 12)
+    bgk_price = (np.exp(-0.05) * np.maximum(paths[:, -1] - 10, 0) * survival[:, -1]).mean()
+
+    assert bgk_price == pytest.approx(discrete_price, rel=0.02)
+    assert bgk_price > analytical_barrier_call(10, 10, 8, 1, 0.45, 0.05, 0, "down-and-out")
+
+
+def test_montecarlo_barrier_errors():
+    mc = MonteCarlo(10, [0.5, 1], 0.45, 0.05, 10)
+    with pytest.raises(ValueError) as e:
+        mc.barrier_survival(mc.generate_paths(), 8, "sideways")
+    assert "Expected direction to be 'up' or 'down'" in e.value.args[0]
+
+    mc = MonteCarlo([10, 12], [0.5, 1], 0.45, 0.05, 10)
+    with pytest.raises(ValueError) as e:
+        mc.barrier_survival(mc.generate_paths(), 8)
+    assert "Barrier monitoring requires a scalar spot price S" in e.value.args[0]
+
+
+def analytical_greeks(S, K, T, sigma, r, q, payoff_type):
+    """
+    Black-Scholes price, delta, vega and rho of European call and cash-or-nothing digital call options
+    """
+    bs = BlackScholes(S, K, T, sigma, r, q)
+    d1, d2 = float(bs.d1), float(bs.d2)
+    N, pdf = NormalDist().cdf, NormalDist().pdf
+    if payoff_type == "call":
+        return {
+            "price": bs.call_price(),
+            "delta": np.exp(-q * T) * N(d1),
+            "vega": S * np.exp(-q * T) * pdf(d1) * np.sqrt(T),
+            "rho": K * T * np.exp(-r * T) * N(d2),
+        }
+    return {
+        "price": np.exp(-r * T) * N(d2),
+        "delta": np.exp(-r * T) * pdf(d2) / (S * sigma * np.sqrt(T)),
+        "vega": -np.exp(-r * T) * pdf(d2) * d1 / sigma,
+        "rho": -T * np.exp(-r * T) * N(d2) + np.exp(-r * T) * pdf(d2) * np.sqrt(T) / sigma,
+    }
+
+
+@pytest.mark.parametrize(
+    "S, K, T, sigma, r, q, payoff_type, method",
+    [
+        param(10, 10, 5, 0.45, 0.05, 0, "call", "pathwise", id="test_call_pathwise"),
+        param(30, 25, [1, 2, 3], 0.20, 0.01, 0.01, "call", "pathwise", id="test_call_pathwise_array_T"),
+        param(10, 10, 5, 0.45, 0.05, 0, "call", "likelihood_ratio", id="test_call_likelihood_ratio"),
+        param(10, 10, 5, 0.45, 0.05, 0, "call", "bump", id="test_call_bump"),
+        param(10, 12, 2, 0.45, 0.03, 0, "digital", "likelihood_ratio", id="test_digital_likelihood_ratio"),
+        param(10, 12, [1, 2], 0.45, 0.03, 0.01, "digital", "likelihood_ratio", id="test_digital_lr_array_T"),
+    ],
+)
+def test_montecarlo_greeks(S, K, T, sigma, r, q, payoff_type, method):
+    if payoff_type == "call":
+
+        def payoff(paths):
+            return np.maximum(paths[:, -1] - K, 0)
+
+        def payoff_grad(paths):
+            grad = np.zeros_like(paths)
+            grad[:, -1] = paths[:, -1] > K
+            return grad
+
+    else:
+
+        def payoff(paths):
+            return (paths[:, -1] > K).astype(float)
+
+        payoff_grad = None
+
+    mc_greeks = MonteCarlo(S, T, sigma, r, n / 5, q).greeks(payoff, payoff_grad, method)
+    expected = analytical_greeks(S, K, np.max(T), sigma, r, q, payoff_type)
+    for greek in ["price", "delta", "vega", "rho"]:
+        # Central differences add O(bump^2) bias on top of simulation error
+        tolerance = zscore * mc_greeks["standard_error"][greek] + (
+            0.01 * abs(expected[greek]) if method == "bump" else 0
+        )
+        assert mc_greeks["greeks"][greek] == pytest.approx(expected[greek], abs=tolerance)
+
+
+def test_montecarlo_greeks_errors():
+    mc = MonteCarlo(10, 5, 0.45, 0.05, 10)
+    with pytest.raises(ValueError) as e:
+        mc.greeks(lambda paths: paths[:, -1], method="pathwise")
+    assert "Expected payoff_grad for pathwise greeks" in e.value.args[0]
+
+    with pytest.raises(ValueError) as e:
+        mc.greeks(lambda paths: paths[:, -1], method="finite_difference")
+    assert "Expected method to be 'pathwise', 'likelihood_ratio' or 'bump'" in e.value.args[0]
+
+    mc = MonteCarlo([10, 12], [0.5, 1], 0.45, 0.05, 10)
+    with pytest.raises(ValueError) as e:
+        mc.greeks(lambda paths: paths[:, -1], method="likelihood_ratio")
+    assert "Greeks require a scalar spot price S" in e.value.args[0]
+
+
+@pytest.mark.parametrize(
+    "S, K, T, sigma, r, q, abs_tol, rel_tol",
+    [
+        param(10, 10, 5, 0.45, 0.05, 0, 0.01, None, id="test_abs_tol"),
+        param(30, 25, [1, 2, 3], 0.20, 0.01, 0.01, None, 0.002, id="test_rel_tol_array_T"),
+    ],
+)
+def test_montecarlo_price_adaptive(S, K, T, sigma, r, q, abs_tol, rel_tol):
+    mc = MonteCarlo(S, T, sigma, r, 10_000, q)
+    result = mc.price_adaptive(lambda paths: np.maximum(paths[:, -1] - K, 0), abs_tol, rel_tol)
+
+    assert result["stop_reason"] == "tolerance"
+    assert result["n_paths"] == 10_000 * result["n_batches"]
+    assert result["n_batches"] > 1
+    assert result["standard_error"] <= max(abs_tol or 0, (rel_tol or 0) * result["price"])
+    assert result["price"] == pytest.approx(
+        BlackScholes(S, K, np.max(T), sigma, r, q).call_price(), abs=zscore * result["standard_error"]
+    )
+
+    # Reproducible for a given seed and tolerance
+    repeat = mc.price_adaptive(lambda paths: np.maximum(paths[:, -1] - K, 0), abs_tol, rel_tol)
+    assert (repeat["price"], repeat["n_paths"]) == (result["price"], result["n_paths"])
+
+
+def test_montecarlo_price_adaptive_limits():
+    mc = MonteCarlo(10, 5, 0.45, 0.05, 10_000)
+
+    def payoff(paths):
+        return np.maximum(paths[:, -1] - 10, 0)
+
+    result = mc.price_adaptive(payoff, abs_tol=1e-6, max_paths=25_000)
+    assert (result["stop_reason"], result["n_paths"], result["n_batches"]) == ("max_paths", 25_000, 3)
+    payoff_pv = np.exp(-0.05 * 5) * payoff(MonteCarlo(10, 5, 0.45, 0.05, 25_000).generate_paths())
+    assert result["standard_error"] == pytest.approx(payoff_pv.std() / np.sqrt(25_000), rel=0.1)
+
+    result = mc.price_adaptive(payoff, abs_tol=1e-6, time_budget=0, batch_size=5_000)
+    assert (result["stop_reason"], result["n_paths"], result["n_batches"]) == ("time_budget", 5_000, 1)
+
+
+@pytest.mark.parametrize(
+    "kwargs, error_message",
+    [
+        param(
+            {}, "Expected at least one of abs_tol, rel_tol, time_budget to be given", id="test_no_stopping_criterion"
+        ),
+        param({"abs_tol": 0.01, "max_paths": 0}, "Expected max_paths to be at least 1", id="test_max_paths_0"),
+    ],
+)
+def test_montecarlo_price_adaptive_errors(kwargs, error_message):
+    mc = MonteCarlo(10, 5, 0.45, 0.05, 10_000)
+    with pytest.raises(ValueError) as e:
+        mc.price_adaptive(lambda paths: np.maximum(paths[:, -1] - 10, 0), **kwargs)
+    assert error_message in e.value.args[0]
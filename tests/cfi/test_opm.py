@@ -0,0 +1,102 @@
+import numpy as np
+import pytest
+from pytest import param
+
+from pyvallib.cfi.blackscholes import BlackScholes
+from pyvallib.cfi.opm import OPM
+
+err_msg_breakpoints = "Expected breakpoints to be a 1-d array of increasing values greater than or equal to 0"
+err_msg_participation_shape = "Expected participation to have shape (number of breakpoints, number of share classes)"
+err_msg_participation_sum = "Expected participation in each tranche to sum to 1"
+err_msg_T_sigma_r = "Expected inputs T, sigma, rfr to be greater than 0"
+
+# Series A: 2m shares, $5m non-participating liquidation preference converting at $2.50/share
+# Common: 8m shares
+breakpoints = [0, 5e6, 25e6]
+participation = [[1, 0], [0, 1], [0.2, 0.8]]
+shares = [2e6, 8e6]
+
+
+@pytest.mark.parametrize(
+    "equity, T, sigma, r, q",
+    [
+        param(10e6, 3, 0.60, 0.04, 0, id="test_normal_1"),
+        param(40e6, 5, 0.45, 0.05, 0, id="test_normal_2"),
+        param(10e6, 3, 0.60, 0.04, 0.01, id="test_normal_q"),
+    ],
+)
+def test_opm(equity, T, sigma, r, q):
+    opm = OPM(breakpoints, participation, shares, T, sigma, r, q)
+    calls = [BlackScholes(equity, k, T, sigma, r, q).call_price() for k in [1e-9, 5e6, 25e6]]
+
+    preferred = calls[0] - calls[1] + 0.2 * calls[2]
+    common = calls[1] - calls[2] + 0.8 * calls[2]
+    assert opm.allocate(equity) == pytest.approx([preferred, common])
+    assert opm.allocate(equity).sum() == pytest.approx(equity * np.exp(-q * T))
+    assert opm.value_per_share(equity) == pytest.approx([preferred / 2e6, common / 8e6])
+
+
+def test_opm_scenarios():
+    equity = np.linspace(1e6, 100e6, 50)
+    sigma = np.linspace(0.3, 0.9, 50)
+    opm = OPM(breakpoints, participation, shares, 3, sigma, 0.04)
+
+    allocation = opm.allocate(equity)
+    assert allocation.shape == (50, 2)
+    for i in [0, 25, 49]:
+        assert allocation[i] == pytest.approx(
+            OPM(breakpoints, participation, shares, 3, sigma[i], 0.04).allocate(equity[i])
+        )
+
+
+@pytest.mark.parametrize("share_class, price", [param(0, 3.10, id="test_preferred"), param(1, 0.85, id="test_common")])
+def test_opm_backsolve(share_class, price):
+    opm = OPM(breakpoints, participation, shares, 3, 0.60, 0.04)
+    equity = opm.backsolve(price, share_class)
+    assert opm.value_per_share(equity)[share_class] == pytest.approx(price)
+    assert opm.backsolve(price, share_class, bracket=(1e6, 1e9)) == pytest.approx(equity)
+    assert opm._backsolve_strip()(equity) == pytest.approx(opm.call_strip(equity))
+
+
+def test_opm_backsolve_large_cap_table():
+    # 20 share classes, each senior class with a liquidation preference then all classes participating pro rata
+    n_classes = 20
+    preferences = np.full(n_classes - 1, 2e6)
+    breakpoints = np.concatenate([[0], np.cumsum(preferences)])
+    participation = np.zeros((n_classes, n_classes))
+    participation[np.arange(n_classes - 1), np.arange(n_classes - 1)] = 1
+    participation[-1] = 1 / n_classes
+    opm = OPM(breakpoints, participation, np.full(n_classes, 1e6), 4, 0.55, 0.04)
+
+    equity = opm.backsolve(1.50, 5)
+    assert opm.value_per_share(equity)[5] == pytest.approx(1.50)
+
+
+@pytest.mark.parametrize(
+    "breakpoints, participation, shares, error_message",
+    [
+        param([0, 5, 5], np.eye(3), [1, 1, 1], err_msg_breakpoints, id="test_breakpoints_not_increasing"),
+        param([-1, 5], np.eye(2), [1, 1], err_msg_breakpoints, id="test_breakpoints_negative"),
+        param([0, 5], np.eye(3), [1, 1], err_msg_participation_shape, id="test_participation_shape"),
+        param([0, 5], [[1, 0], [0.5, 0.4]], [1, 1], err_msg_participation_sum, id="test_participation_sum"),
+    ],
+)
+def test_opm_errors(breakpoints, participation, shares, error_message):
+    with pytest.raises(ValueError) as e:
+        OPM(breakpoints, participation, shares, 3, 0.60, 0.04)
+    assert error_message in e.value.args[0]
+
+
+@pytest.mark.parametrize(
+    "T, sigma, r",
+    [
+        param(0, 0.60, 0.04, id="test_T_zero"),
+        param(3, -0.60, 0.04, id="test_sigma_negative"),
+        param(3, [0.60, 0], 0.04, id="test_sigma_array"),
+        param(3, 0.60, -0.04, id="test_r_negative"),
+    ],
+)
+def test_opm_input_errors(T, sigma, r):
+    with pytest.raises(ValueError) as e:
+        OPM(breakpoints, participation, shares, T, sigma, r)
+    assert err_msg_T_sigma_r in e.value.args[0]
@@ -0,0 +1,82 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pyvallib.cfi.binomial import BinomialAmerican
+from pyvallib.cfi.blackscholes import BlackScholes
+from pyvallib.dlom.chaffe import Chaffe
+from pyvallib.dlom.differential_put import DifferentialPut
+from pyvallib.dlom.finnerty import Finnerty
+from pyvallib.dlom.ghaidarov import Ghaidarov
+from pyvallib.portfolio import Portfolio
+
+instruments = pd.DataFrame(
+    [
+        {"model": "BlackScholes", "option_type": "call", "S": 10, "K": 10, "T": 5, "sigma": 0.45, "r": 0.05},
+        {"model": "Chaffe", "T": 5, "sigma": 0.45, "r": 0.05},
+        {
+            "model": "BinomialAmerican",
+            "option_type": "put",
+            "S": 10,
+            "K": 10,
+            "T": 5,
+            "sigma": 0.45,
+            "r": 0.05,
+            "M": 50,
+        },
+        {"model": "BlackScholes", "option_type": "put", "S": 30, "K": 25, "T": 3, "sigma": 0.20, "r": 0.01},
+        {"model": "MonteCarlo", "option_type": "call", "S": 10, "K": 10, "T": 5, "sigma": 0.45, "r": 0.05, "n": 1e5},
+        {"model": "BlackScholes", "option_type": "call", "S": 30, "K": 25, "T": 3, "sigma": 0.20, "r": 0.01, "q": 0.01},
+        {"model": "DifferentialPut", "T": 5, "sigma_preferred": 0.30, "sigma_common": 0.45, "r": 0.05},
+        {"model": "Finnerty", "T": 5, "sigma": 0.45},
+        {"model": "Ghaidarov", "T": 5, "sigma": 0.45, "q": 0.01},
+        # Invalid rows
+        {"model": "BlackScholes", "option_type": "call", "S": 10, "K": 10, "T": 5, "sigma": -0.45, "r": 0.05},
+        {"model": "BlackScholes", "option_type": "call", "S": 10, "T": 5, "sigma": 0.45, "r": 0.05},
+        {"model": "Unknown"},
+        {"model": "BlackScholes", "option_type": "call", "S": [10], "K": 10, "T": 5, "sigma": 0.45, "r": 0.05},
+        {"model": ["BlackScholes"], "option_type": "call", "S": 10, "K": 10, "T": 5, "sigma": 0.45, "r": 0.05},
+        {"model": "BinomialAmerican", "S": 10, "K": 10, "T": 5, "sigma": 0.45, "r": 0.05, "M": np.inf},
+    ],
+    index=list("abcdefghijklmno"),
+)
+
+expected = [
+    BlackScholes(10, 10, 5, 0.45, 0.05).call_price(),
+    Chaffe(5, 0.45, 0.05).calculate_dlom(),
+    BinomialAmerican(10, 10, 5, 0.45, 0.05, 50).put_price(),
+    BlackScholes(30, 25, 3, 0.20, 0.01).put_price(),
+    BlackScholes(10, 10, 5, 0.45, 0.05).call_price(),
+    BlackScholes(30, 25, 3, 0.20, 0.01, 0.01).call_price(),
+    DifferentialPut(5, 0.30, 0.45, 0.05).calculate_dlom(),
+    Finnerty(5, 0.45).calculate_dlom(),
+    Ghaidarov(5, 0.45, 0.01).calculate_dlom(),
+]
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_portfolio(max_workers):
+    results = Portfolio(instruments, max_workers=max_workers).value()
+
+    assert results.index.equals(instruments.index)
+    assert (results["model"] == instruments["model"]).all()
+    assert results["value"].iloc[:9].to_numpy() == pytest.approx(expected, rel=0.01)
+    assert results["value"].iloc[[0, 1, 2, 3, 5, 6, 7, 8]].to_numpy() == pytest.approx(
+        [expected[i] for i in [0, 1, 2, 3, 5, 6, 7, 8]]
+    )
+    assert results["error"].iloc[:9].isna().all()
+    assert (results["elapsed"].iloc[:9] > 0).all()
+
+    assert np.isnan(results["value"].iloc[9:]).all()
+    assert "Expected inputs T, sigma, rfr to be greater than 0" in results.loc["j", "error"]
+    assert "Missing inputs ['K']" in results.loc["k", "error"]
+    assert "Unknown model 'Unknown'" in results.loc["l", "error"]
+    assert results.loc["m", "error"].startswith("TypeError: float() argument")
+    assert "TypeError: unhashable type: 'list'" in results.loc["n", "error"]
+    assert "OverflowError: cannot convert float infinity to integer" in results.loc["o", "error"]
+
+
+def test_portfolio_missing_model_column():
+    with pytest.raises(ValueError) as e:
+        Portfolio(instruments.drop(columns="model"))
+    assert "Expected instruments to have a 'model' column" in e.value.args[0]
@@ -0,0 +1,61 @@
+import pandas as pd
+import pytest
+
+from pyvallib.cfi.binomial import BinomialAmerican
+from pyvallib.cfi.blackscholes import BlackScholes
+from pyvallib.cfi.montecarlo import MonteCarlo
+from pyvallib.profiling import instrument, phase, profile
+from pyvallib.pv.yearfrac import yearfrac
+
+
+def test_profile_records_phases():
+    with profile() as profiler:
+        BinomialAmerican(10, 10, 5, 0.45, 0.05, 100).put_price()
+        MonteCarlo(10, [1, 2, 3], 0.45, 0.05, 1000).generate_paths()
+        BlackScholes(10, 10, 5, 0.45, 0.05).call_price()
+        yearfrac(pd.Timestamp(2020, 1, 1), pd.Timestamp(2021, 1, 1), 1)
+        with phase("payoff"):
+            pass
+
+    summary = profiler.summary()
+    assert set(summary) == {
+        "binomial.rollback_lattice",
+        "binomial.generate_lattice",
+        "montecarlo.generate_paths",
+        "montecarlo.standard_normals",
+        "blackscholes.call_price",
+        "pv.yearfrac",
+        "payoff",
+    }
+    assert all(stats["calls"] == 1 for stats in summary.values())
+
+    records = {record.phase: record for record in profiler.records}
+    assert records["binomial.generate_lattice"].parent == "binomial.rollback_lattice"
+    assert records["binomial.generate_lattice"].depth == 1
+    assert records["binomial.generate_lattice"].shape == (101, 101)
+    assert records["binomial.generate_lattice"].nbytes == 101 * 101 * 8
+    assert records["montecarlo.standard_normals"].shape == (1000, 3)
+
+    rollback = records["binomial.rollback_lattice"]
+    assert rollback.parent is None
+    assert rollback.self_elapsed == pytest.approx(rollback.elapsed - records["binomial.generate_lattice"].elapsed)
+
+
+def test_profile_inactive():
+    with profile() as profiler:
+        pass
+    BlackScholes(10, 10, 5, 0.45, 0.05).call_price()
+    assert profiler.records == []
+
+
+def test_profile_call_counts_and_records():
+    @instrument("double")
+    def double(x):
+        return 2 * x
+
+    with profile() as profiler:
+        assert [double(x) for x in range(3)] == [0, 2, 4]
+
+    assert profiler.summary()["double"]["calls"] == 3
+    assert [record["phase"] for record in profiler.to_records()] == ["double"] * 3
+    assert double(5) == 10
@@ -0,0 +1,140 @@
+import asyncio
+import json
+
+import pandas as pd
+import pytest
+
+from pyvallib.cfi.blackscholes import BlackScholes
+from pyvallib.dlom.chaffe import Chaffe
+from pyvallib.dlom.finnerty import Finnerty
+from pyvallib.pv.yearfrac import yearfrac
+from pyvallib.service import MicroBatcher, PricingService
+
+
+def test_micro_batcher():
+    batches = []
+
+    def double(requests):
+        batches.append(len(requests))
+        return [ValueError("negative") if x < 0 else 2 * x for x in requests]
+
+    async def run():
+        batcher = MicroBatcher(double, window=0.01, max_batch=8)
+        results = await asyncio.gather(*(batcher.submit(x) for x in [1, 2, -3, 4, 5]), return_exceptions=True)
+        full_batch = await asyncio.gather(*(batcher.submit(x) for x in range(8)))
+        return results, full_batch
+
+    results, full_batch = asyncio.run(run())
+    assert results[:2] == [2, 4] and results[3:] == [8, 10]
+    assert isinstance(results[2], ValueError)
+    assert full_batch == [2 * x for x in range(8)]
+    assert batches == [5, 8]
+
+
+async def post(port, path, payload, method="POST"):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    body = json.dumps(payload).encode()
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nContent-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode() + body
+    )
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    response = (await reader.read()).split(b"\r\n\r\n", 1)[1]
+    writer.close()
+    return status, json.loads(response)
+
+
+def test_pricing_service():
+    requests = [
+        ("/blackscholes", {"S": 10, "K": 10, "T": 5, "sigma": 0.45, "r": 0.05}),
+        ("/blackscholes", {"S": 30, "K": 25, "T": 3, "sigma": 0.20, "r": 0.01, "option_type": "put"}),
+        ("/blackscholes", {"S": 10, "K": 15, "T": 8, "sigma": 0.90, "r": 0.03, "q": 0.01}),
+        ("/dlom/chaffe", {"T": 5, "sigma": 0.45, "r": 0.05}),
+        ("/dlom/finnerty", {"T": 5, "sigma": 0.45}),
+        ("/yearfrac", {"start_date": "2020-02-29", "end_date": "2021-06-30", "basis": 1}),
+    ]
+    expected = [
+        BlackScholes(10, 10, 5, 0.45, 0.05).call_price(),
+        BlackScholes(30, 25, 3, 0.20, 0.01).put_price(),
+        BlackScholes(10, 15, 8, 0.90, 0.03, 0.01).call_price(),
+        Chaffe(5, 0.45, 0.05).calculate_dlom(),
+        Finnerty(5, 0.45).calculate_dlom(),
+        yearfrac(pd.Timestamp(2020, 2, 29), pd.Timestamp(2021, 6, 30), 1),
+    ]
+
+    async def run():
+        service = PricingService(port=0, window=0.01)
+        await service.start()
+        try:
+            results = await asyncio.gather(*(post(service.port, path, payload) for path, payload in requests))
+            errors = await asyncio.gather(
+                post(service.port, "/blackscholes", {"S": 10, "K": 10, "T": 5, "sigma": -0.45, "r": 0.05}),
+                post(service.port, "/blackscholes", {"S": 10, "T": 5, "sigma": 0.45, "r": 0.05}),
+                post(service.port, "/unknown", {}),
+                post(service.port, "/blackscholes", {}, method="GET"),
+            )
+        finally:
+            await service.close()
+        return results, errors
+
+    results, errors = asyncio.run(run())
+    assert [status for status, _ in results] == [200] * len(requests)
+    assert [response["value"] for _, response in results] == pytest.approx(expected)
+
+    assert [status for status, _ in errors] == [400, 400, 404, 405]
+    assert "Expected inputs T, sigma, rfr to be greater than 0" in errors[0][1]["error"]
+    assert "Missing inputs ['K'] for BlackScholes" in errors[1][1]["error"]
+
+
+def test_pricing_service_invalid_request_in_batch():
+    good_yearfrac = {"start_date": "2020-02-29", "end_date": "2021-06-30", "basis": 1}
+    good_blackscholes = {"S": 10, "K": 10, "T": 5, "sigma": 0.45, "r": 0.05}
+
+    async def run():
+        service = PricingService(port=0, window=0.05)
+        await service.start()
+        try:
+            return await asyncio.gather(
+                post(service.port, "/yearfrac", good_yearfrac),
+                post(service.port, "/yearfrac", {**good_yearfrac, "basis": float("inf")}),
+                post(service.port, "/blackscholes", good_blackscholes),
+                post(service.port, "/blackscholes", {**good_blackscholes, "S": [10]}),
+                post(service.port, "/blackscholes", {**good_blackscholes, "S": 0, "K": 0}),
+            )
+        finally:
+            await service.close()
+
+    responses = asyncio.run(run())
+    assert [status for status, _ in responses] == [200, 400, 200, 400, 400]
+    assert responses[0][1]["value"] == pytest.approx(yearfrac(pd.Timestamp(2020, 2, 29), pd.Timestamp(2021, 6, 30), 1))
+    assert "OverflowError" in responses[1][1]["error"]
+    assert responses[2][1]["value"] == pytest.approx(BlackScholes(10, 10, 5, 0.45, 0.05).call_price())
+    assert "float() argument" in responses[3][1]["error"]
+    assert "Inputs do not produce a finite result" in responses[4][1]["error"]
+
+
+@pytest.mark.parametrize(
+    "request_bytes",
+    [
+        pytest.param(b"GARBAGE\r\n\r\n", id="test_request_line"),
+        pytest.param(b"POST /blackscholes HTTP/1.1\r\nContent-Length: ten\r\n\r\n", id="test_content_length"),
+        pytest.param(b"POST /blackscholes HTTP/1.1\r\nContent-Length: -1\r\n\r\n", id="test_negative_length"),
+    ],
+)
+def test_pricing_service_malformed_request(request_bytes):
+    async def run():
+        service = PricingService(port=0)
+        await service.start()
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", service.port)
+            writer.write(request_bytes)
+            await writer.drain()
+            response = await reader.read()
+            writer.close()
+            return response
+        finally:
+            await service.close()
+
+    status_line, response = asyncio.run(run()).split(b"\r\n", 1)
+    assert status_line == b"HTTP/1.1 400 Bad Request"
+    assert json.loads(response.split(b"\r\n\r\n", 1)[1]) == {"error": "Malformed HTTP request"}